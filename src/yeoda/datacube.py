@@ -32,21 +32,24 @@ Main code for creating data cubes.
 """
 
 # general packages
-import copy
+import operator
 import os
 import re
 import pandas as pd
 import numpy as np
 import xarray as xr
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # geo packages
 from osgeo import osr
 from osgeo import ogr
-import shapely.wkt
+import shapely.wkb
 from shapely.geometry import Point
 from geopandas import GeoSeries
 from geopandas import GeoDataFrame
+from geopandas import read_file
+from geopandas import read_parquet
 from geopandas.base import is_geometry_type
 import pytileproj.geometry as geometry
 from veranda.io.geotiff import GeoTiffFile
@@ -72,6 +75,17 @@ from yeoda.errors import SpatialInconsistencyError
 
 # TODO: resolve geometry/tile columns and simplify queries
 
+# comparison operators allowed for filtering a dimension
+_OPS = {'==': operator.eq,
+        '!=': operator.ne,
+        '>=': operator.ge,
+        '<=': operator.le,
+        '>': operator.gt,
+        '<': operator.lt}
+
+# regular expressions which only search for a literal substring, e.g. ".*SIG0.*"
+_LITERAL_PATTERN = re.compile(r"^(?:\.\*)?([\w\-]+)(?:\.\*)?\Z")
+
 
 def _check_inventory(f):
     """
@@ -130,6 +144,26 @@ def _set_status(status):
     return decorator
 
 
+def _duplicated(inventory):
+    """
+    Marks duplicated entries of an inventory. Boundary geometries are retrieved lazily, i.e. the same file can have a
+    geometry in one data cube and none in another one, so the geometry column is ignored.
+
+    Parameters
+    ----------
+    inventory : GeoDataFrame
+        Data cube inventory.
+
+    Returns
+    -------
+    pandas.Series
+        Boolean series being true for all duplicated entries.
+    """
+
+    columns = [column for column in inventory.columns if column != 'geometry']
+    return inventory.duplicated(subset=columns)
+
+
 class EODataCube:
     """
     A file(name) based data cube for preferably gridded and well-structured EO data.
@@ -153,7 +187,9 @@ class EODataCube:
             fields definition.
         inventory : GeoDataFrame, optional
             Contains information about the dimensions (columns) and each filepath (rows).
-            If `grid` is not specified, a `Shapely` geometry object is added to the `GeoDataFrame`.
+            If `grid` is not specified and no geometry column is available, an empty 'geometry' column is added to
+            the `GeoDataFrame`. The boundary geometries of the files are only retrieved when they are needed, e.g.
+            when calling `load_geometries`, `filter_spatially_by_geom` or `to_parquet`.
         io_map : dictionary, optional
             Map that represents the relation of an EO file type (e.g. GeoTIFF) with an appropriate reader
             (e.g. `GeoTiffFile` from veranda).
@@ -166,6 +202,8 @@ class EODataCube:
 
         # initialise simple class variables
         self._ds = None  # data set pointer
+        self._metadata_cache = dict()  # metadata of already opened files, shared with derived data cubes
+        self._sindex_ref = None  # spatial index and its index labels, possibly from a parent data cube
         self.status = None
         self.tdim_name = tdim_name
 
@@ -188,12 +226,38 @@ class EODataCube:
             self.grid = grid
             self.sdim_name = sdim_name
         elif (self.inventory is not None) and ('geometry' not in self.inventory.keys()):
-            geometries = [self.__geometry_from_file(filepath) for filepath in self.filepaths]
             self.sdim_name = sdim_name if sdim_name in self.dimensions else "geometry"
+            # boundary geometries are only retrieved from the files when they are needed
+            geometries = GeoSeries([None] * len(self.inventory), index=self.inventory.index)
             self.add_dimension('geometry', geometries, inplace=True)
         else:
             self.sdim_name = sdim_name
 
+    @property
+    def inventory(self):
+        """
+        GeoDataFrame : Contains information about the dimensions (columns) and each filepath (rows). If the data cube
+        has no grid, the 'geometry' column is filled lazily, i.e. it contains `None` for all files whose boundary
+        geometries have not been retrieved yet (see `load_geometries`).
+        """
+
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, inventory):
+        """
+        Sets the inventory of the data cube. An existing spatial index can not be related to the new inventory
+        anymore, so its reference is removed.
+
+        Parameters
+        ----------
+        inventory : GeoDataFrame
+            Contains information about the dimensions (columns) and each filepath (rows).
+        """
+
+        self._inventory = inventory
+        self._sindex_ref = None
+
     @property
     def filepaths(self):
         """
@@ -253,6 +317,70 @@ class EODataCube:
 
         return cls(inventory=inventory, grid=grid, **kwargs)
 
+    @classmethod
+    def from_geofile(cls, filepath, geom=None, sref=None, grid=None, **kwargs):
+        """
+        Creates an `EODataCube` instance from an inventory stored in a vector file (e.g. GeoPackage or Shapefile).
+        If a region of interest is given, it is used as a spatial mask when reading the file, i.e. only
+        intersecting entries are read.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to a vector file containing the inventory.
+        geom : OGR Geometry or Shapely Geometry or list or tuple, optional
+            A geometry defining the region of interest. It has to be given in the spatial reference of the stored
+            inventory. If it is of type list/tuple representing the extent (i.e. [x_min, y_min, x_max, y_max]),
+            `sref` has to be given to transform the extent into a georeferenced polygon.
+        sref : osr.SpatialReference, optional
+            Spatial reference of the given region of interest `geom`.
+        grid : pytileproj.base.TiledProjection, optional
+            Tiled projection/grid object/class (e.g. `Equi7Grid`, `LatLonGrid`).
+
+        Returns
+        -------
+        EODataCube
+            Data cube consisting of data stored in the vector file.
+        """
+
+        mask = None
+        if geom is not None:
+            geom_roi = any_geom2ogr_geom(geom, osr_sref=sref)
+            mask = shapely.wkb.loads(bytes(geom_roi.ExportToWkb()))
+
+        # the spatial filter is applied by fiona/OGR while reading the file
+        inventory = read_file(filepath, mask=mask)
+        return cls.from_inventory(inventory, grid=grid, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, filepath, grid=None, **kwargs):
+        """
+        Creates an `EODataCube` instance from an inventory stored as a (Geo)Parquet file, which avoids parsing
+        filenames and opening files again. This requires the optional dependency `pyarrow`.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to a Parquet file written by `EODataCube.to_parquet`.
+        grid : pytileproj.base.TiledProjection, optional
+            Tiled projection/grid object/class (e.g. `Equi7Grid`, `LatLonGrid`).
+
+        Returns
+        -------
+        EODataCube
+            Data cube consisting of data stored in the Parquet file.
+        """
+
+        import pyarrow.parquet as pq  # optional dependency, see the 'parquet' extra
+
+        metadata = pq.read_schema(filepath).metadata
+        if metadata is not None and b'geo' in metadata.keys():
+            inventory = read_parquet(filepath)
+        else:  # no geometry column has been written
+            inventory = GeoDataFrame(pd.read_parquet(filepath))
+
+        return cls.from_inventory(inventory, grid=grid, **kwargs)
+
     @_check_inventory
     def rename_dimensions(self, dimensions_map, inplace=False):
         """
@@ -281,8 +409,7 @@ class EODataCube:
             if self.tdim_name == old_dimension:
                 self.tdim_name = dimensions_map[old_dimension]
 
-        inventory = copy.deepcopy(self.inventory)
-        inventory = inventory.rename(columns=dimensions_map)
+        inventory = self.inventory.rename(columns=dimensions_map)
         return self.__assign_inventory(inventory, inplace=inplace)
 
     @_check_inventory
@@ -322,7 +449,7 @@ class EODataCube:
 
         Parameters
         ----------
-        pattern : str
+        pattern : str or re.Pattern
             A regular expression (e.g., ".*S1A.*GRD.*").
         full_path : boolean, optional
             Uses the full file paths for filtering if it is set to True.
@@ -337,14 +464,21 @@ class EODataCube:
             `EODataCube` object with a filtered inventory according to the given pattern.
         """
 
-        pattern = re.compile(pattern)
+        pattern = re.compile(pattern)  # already compiled patterns are returned as they are
+        filepaths = self.inventory['filepath']
         if not full_path:
-            file_filter = lambda x: re.search(pattern, os.path.basename(x)) is not None
+            filepaths = filepaths.map(os.path.basename)
+        literal_match = _LITERAL_PATTERN.match(pattern.pattern) if isinstance(pattern.pattern, str) else None
+        if literal_match is not None and not pattern.flags & re.IGNORECASE:
+            # simple patterns are searched as plain substrings without involving the regex engine
+            idx_filter = filepaths.str.contains(literal_match.group(1), regex=False, na=False)
+        elif pattern.groups > 0:
+            # pandas warns about match groups in `str.contains`, so these patterns are searched directly
+            idx_filter = filepaths.map(lambda x: isinstance(x, str) and pattern.search(x) is not None)
         else:
-            file_filter = lambda x: re.search(pattern, x) is not None
-        idx_filter = [file_filter(filepath) for filepath in self.filepaths]
-        inventory = self.inventory[idx_filter]
-        return self.__assign_inventory(inventory, inplace=inplace)
+            idx_filter = filepaths.str.contains(pattern, regex=True, na=False)
+        inventory = self.inventory[idx_filter.values]
+        return self.__assign_inventory(inventory, inplace=inplace, subset=True)
 
     @_set_status('changed')
     @_check_inventory
@@ -366,27 +500,18 @@ class EODataCube:
             `EODataCube` object with a filtered inventory according to the given metadata.
         """
 
-        bool_filter = []
-        for filepath in self.filepaths:
-            io_class = self.__io_class(get_file_type(filepath))
-            io_instance = io_class(filepath, mode='r')
+        ds_metadatas = self.__map_files(self.__metadata_from_file, self.filepaths)
 
+        bool_filter = []
+        for ds_metadata in ds_metadatas:
             select = False
-            if io_instance.src:
-                ds_metadata = io_instance.metadata
-                select = True
-                for key, value in metadata.items():
-                    if key not in ds_metadata.keys():
-                        select = False
-                    else:
-                        if ds_metadata[key] != value:
-                            select = False
-            # close data set
-            io_instance.close()
+            if ds_metadata is not None:
+                select = all([(key in ds_metadata.keys()) and (ds_metadata[key] == value)
+                              for key, value in metadata.items()])
             bool_filter.append(select)
 
         inventory = self.inventory[bool_filter]
-        return self.__assign_inventory(inventory, inplace=inplace)
+        return self.__assign_inventory(inventory, inplace=inplace, subset=True)
 
     @_set_status('changed')
     @_check_inventory
@@ -410,10 +535,9 @@ class EODataCube:
             Sorted EODataCube object.
         """
 
-        inventory = copy.deepcopy(self.inventory)
-        inventory_sorted = inventory.sort_values(by=name, ascending=ascending)
+        inventory_sorted = self.inventory.sort_values(by=name, ascending=ascending)
 
-        return self.__assign_inventory(inventory=inventory_sorted)
+        return self.__assign_inventory(inventory=inventory_sorted, subset=True)
 
     @_set_status('changed')
     def filter_by_dimension(self, values, expressions=None, name="time", inplace=False):
@@ -429,6 +553,7 @@ class EODataCube:
             are taken, otherwise the expressions are applied for each value and linked with an AND (e.g., ('>=', '<=')).
             They have to have the same length as 'values'. The following comparison operators are allowed:
             - '==': equal to
+            - '!=': not equal to
             - '>=': larger than or equal to
             - '<=': smaller than or equal to
             - '>':  larger than
@@ -489,7 +614,9 @@ class EODataCube:
     @_check_inventory
     def filter_spatially_by_geom(self, geom, sref=None, inplace=False):
         """
-        Spatially filters the data cube by a bounding box or a geometry.
+        Spatially filters the data cube by a bounding box or a geometry. If the data cube has no grid, the boundary
+        geometries of all files, which have not been retrieved yet, are read from the files. They are kept in the
+        inventory of this data cube, even if `inplace` is false.
 
         Parameters
         ----------
@@ -520,11 +647,17 @@ class EODataCube:
             tilenames = [ftilename.split('_')[1] for ftilename in ftilenames]
             return self.filter_spatially_by_tilename(tilenames, inplace=inplace, use_grid=False)
         elif 'geometry' in self.inventory.keys():
+            self.__ensure_geometry()
             # get spatial reference of data
             geom_roi = self.align_geom(geom_roi)
-            geom_roi = shapely.wkt.loads(geom_roi.ExportToWkt())
-            inventory = self.inventory[self.inventory.intersects(geom_roi)]
-            return self.__assign_inventory(inventory, inplace=inplace)
+            geom_roi = shapely.wkb.loads(bytes(geom_roi.ExportToWkb()))
+            sindex, sindex_idxs = self.__spatial_index()
+            if sindex is not None:
+                idxs = sindex.query(geom_roi, predicate='intersects')
+                inventory = self.inventory[np.isin(sindex_idxs, idxs)]
+            else:  # no spatial index backend (rtree or pygeos) is installed
+                inventory = self.inventory[self.inventory.intersects(geom_roi).values]
+            return self.__assign_inventory(inventory, inplace=inplace, subset=True)
         else:
             return self
 
@@ -541,6 +674,7 @@ class EODataCube:
             are taken, otherwise the expressions are applied for each value and linked with an AND (e.g., ('>=', '<=')).
             They have to have the same length as 'values'. The following comparison operators are allowed:
             - '==': equal to
+            - '!=': not equal to
             - '>=': larger than or equal to
             - '<=': smaller than or equal to
             - '>':  larger than
@@ -571,43 +705,26 @@ class EODataCube:
         List of monthly `EODataCube` objects.
         """
 
-        sort = False
-        yearly_eodcs = self.split_yearly()
+        if months is not None and not isinstance(months, list):
+            months = [months]
+
+        # group the inventory by year and month in one pass
+        timestamps = pd.to_datetime(self.inventory[self.tdim_name])
+        monthly_inventories = dict(list(self.inventory.groupby([timestamps.dt.year, timestamps.dt.month])))
+
+        years = sorted(set([year for year, _ in monthly_inventories.keys()]))  # sort in ascending order
         monthly_eodcs = []
-        for yearly_eodc in yearly_eodcs:
+        for year in years:
             if months is not None:
                 yearly_months = months
-                if not isinstance(months, list):
-                    yearly_months = [yearly_months]
-                # initialise empty dict keeping track of the months
-                timestamps_months = {}
-                for month in yearly_months:
-                    timestamps_months[month] = []
-
-                for timestamp in yearly_eodc.inventory[self.tdim_name]:
-                    if timestamp.month in yearly_months:
-                        timestamps_months[timestamp.month].append(timestamp)
             else:
-                sort = True
-                timestamps_months = {}
-                for timestamp in yearly_eodc.inventory[self.tdim_name]:
-                    if timestamp.month not in timestamps_months.keys():
-                        timestamps_months[timestamp.month] = []
-
-                    timestamps_months[timestamp.month].append(timestamp)
+                yearly_months = sorted([month for year_i, month in monthly_inventories.keys() if year_i == year])
 
-                yearly_months = timestamps_months.keys()
-
-            if sort:
-                yearly_months = sorted(yearly_months)  # sort in ascending order
-            values = []
-            expressions = [(">=", "<=")] * len(yearly_months)
             for month in yearly_months:
-                min_timestamp = min(timestamps_months[month])
-                max_timestamp = max(timestamps_months[month])
-                values.append((min_timestamp, max_timestamp))
-
-            monthly_eodcs.extend(self.split_by_dimension(values, expressions, name=self.tdim_name))
+                if (year, month) in monthly_inventories.keys():
+                    monthly_eodc = self.__assign_inventory(monthly_inventories[(year, month)], inplace=False,
+                                                           subset=True)
+                    monthly_eodcs.append(monthly_eodc)
 
         return monthly_eodcs
 
@@ -627,39 +744,18 @@ class EODataCube:
         List of yearly EODataCube objects.
         """
 
-        sort = False
+        # group the inventory by year in one pass
+        timestamps = pd.to_datetime(self.inventory[self.tdim_name])
+        yearly_inventories = dict(list(self.inventory.groupby(timestamps.dt.year)))
+
         if years:
             if not isinstance(years, list):
                 years = [years]
-            # initialise empty dict keeping track of the years
-            timestamps_years = {}
-            for year in years:
-                timestamps_years[year] = []
-
-            for timestamp in self.inventory[self.tdim_name]:
-                if timestamp.year in years:
-                    timestamps_years[timestamp.year].append(timestamp)
         else:
-            sort = True
-            timestamps_years = {}
-            for timestamp in self.inventory[self.tdim_name]:
-                if timestamp.year not in timestamps_years.keys():
-                    timestamps_years[timestamp.year] = []
-
-                timestamps_years[timestamp.year].append(timestamp)
-
-            years = timestamps_years.keys()
-
-        if sort:
-            years = sorted(years)  # sort in ascending order
-        values = []
-        expressions = [(">=", "<=")]*len(years)
-        for year in years:
-            min_timestamp = min(timestamps_years[year])
-            max_timestamp = max(timestamps_years[year])
-            values.append((min_timestamp, max_timestamp))
+            years = sorted(yearly_inventories.keys())  # sort in ascending order
 
-        return self.split_by_dimension(values, expressions, name=self.tdim_name)
+        return [self.__assign_inventory(yearly_inventories[year], inplace=False, subset=True)
+                for year in years if year in yearly_inventories.keys()]
 
     @_set_status('stable')
     def load_by_geom(self, geom, sref=None, band=1, apply_mask=False, dtype="xarray", origin='ul'):
@@ -736,7 +832,7 @@ class EODataCube:
         col_size = max_col - min_col
         row_size = max_row - min_row
         if apply_mask:
-            geom_roi = shapely.wkt.loads(geom_roi.ExportToWkt())
+            geom_roi = shapely.wkb.loads(bytes(geom_roi.ExportToWkb()))
             data_mask = np.ones((row_size, col_size))
             for col in range(col_size):
                 for row in range(row_size):
@@ -1087,16 +1183,15 @@ class EODataCube:
             Data cube with common values along the given dimension with respect to another data cube.
         """
 
-        this_dim_values = list(self.inventory[name])
-        uni_values = list(set(this_dim_values))
-        other_dim_values = dc_other.inventory[name]
-        idxs = np.zeros(len(other_dim_values)) - 1  # set -1 as no data value
+        this_dim_values = self.inventory[name]
+        # index of the first occurrence of each value in this data cube
+        is_first = ~this_dim_values.duplicated().values
+        first_idxs = np.flatnonzero(is_first)
+        uni_values = pd.Index(np.asarray(this_dim_values)[is_first])
+        other_dim_values = np.asarray(dc_other.inventory[name])
+        uni_idxs = uni_values.get_indexer(other_dim_values)  # -1 is the no data value
 
-        for i in range(len(uni_values)):
-            val_idxs = np.where(uni_values[i] == other_dim_values)
-            idxs[val_idxs] = this_dim_values.index(uni_values[i])  # get index of value in this data cube
-
-        idxs = idxs[idxs != -1]
+        idxs = first_idxs[uni_idxs[uni_idxs != -1]]
         if len(idxs) > 0:
             inventory = self.inventory.iloc[idxs].reset_index(drop=True)
             return self.__assign_inventory(inventory, inplace=inplace)
@@ -1106,7 +1201,10 @@ class EODataCube:
 
     def clone(self):
         """
-        Clones, i.e. deep-copies a data cube.
+        Clones, i.e. copies a data cube. The inventory and the IO map are copied, whereas the grid is shared with the
+        original data cube and therefore has to be treated as immutable. The cache of file metadata is shared as
+        well, since the metadata only depends on the files themselves. The constructor is not called again, so that
+        also data cubes of subclasses can be cloned without re-initialising them.
 
         Returns
         -------
@@ -1114,7 +1212,53 @@ class EODataCube:
             Cloned/copied data cube.
         """
 
-        return copy.deepcopy(self)
+        dc = self.__class__.__new__(self.__class__)
+        dc.__dict__.update(self.__dict__)
+        dc._ds = None
+        dc.io_map = dict(self.io_map)
+        dc.inventory = self.inventory.copy() if self.inventory is not None else None
+        # the copied inventory has the same index and geometries, so the spatial index stays valid
+        dc._sindex_ref = self._sindex_ref
+
+        return dc
+
+    @_check_inventory
+    def to_parquet(self, filepath):
+        """
+        Writes the inventory of the data cube to a (Geo)Parquet file, which can be read again with
+        `EODataCube.from_parquet`. Boundary geometries, which have not been retrieved yet, are read from the files
+        before writing, i.e. every such file is opened once. They are also kept in the inventory of this data cube.
+        This requires the optional dependency `pyarrow`.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the Parquet file.
+        """
+
+        if 'geometry' in self.inventory.keys():
+            self.__ensure_geometry()
+            self.inventory.to_parquet(filepath)
+        else:
+            pd.DataFrame(self.inventory).to_parquet(filepath)
+
+    @_check_inventory
+    def load_geometries(self):
+        """
+        Retrieves the boundary geometries of all files in the inventory, which do not have a geometry assigned yet,
+        and stores them in the 'geometry' column of the inventory. Data cubes without a grid only retrieve these
+        geometries when they are needed, so this function can be used to fill the complete 'geometry' column
+        in advance, e.g. before working with the inventory directly.
+
+        Returns
+        -------
+        EODataCube
+            This data cube with all boundary geometries being available in the inventory.
+        """
+
+        self.__ensure_geometry()
+
+        return self
 
     def align_geom(self, geom, sref=None):
         """
@@ -1273,6 +1417,31 @@ class EODataCube:
         else:
             return self.io_map[file_type]
 
+    def __metadata_from_file(self, filepath):
+        """
+        Retrieves metadata from an EO file. The metadata is cached, so that each file is only opened once.
+
+        Parameters
+        ----------
+        filepath : str
+            Filepath or filename of a geospatial file (e.g. NetCDF or GeoTIFF).
+
+        Returns
+        -------
+        dict
+            Metadata of the file or `None` if the file can not be opened.
+        """
+
+        if filepath not in self._metadata_cache.keys():
+            io_class = self.__io_class(get_file_type(filepath))
+            io_instance = io_class(filepath, mode='r')
+            ds_metadata = io_instance.metadata if io_instance.src else None
+            # close data set
+            io_instance.close()
+            self._metadata_cache[filepath] = ds_metadata
+
+        return self._metadata_cache[filepath]
+
     def __geometry_from_file(self, filepath):
         """
         Retrieves boundary geometry from an EO file.
@@ -1295,7 +1464,127 @@ class EODataCube:
         # close data set
         io_instance.close()
 
-        return shapely.wkt.loads(boundary_geom.ExportToWkt())
+        return shapely.wkb.loads(bytes(boundary_geom.ExportToWkb()))
+
+    def __spatial_index(self):
+        """
+        Retrieves a spatial index covering all geometries of the inventory. If the data cube was derived by filtering
+        another data cube, whose spatial index has already been built, this spatial index is reused.
+
+        Returns
+        -------
+        sindex : geopandas.sindex.SpatialIndex
+            Spatial index or `None` if no spatial index backend (rtree or pygeos) is available.
+        sindex_idxs : numpy.ndarray
+            Positions of the entries of the inventory within the spatial index.
+        """
+
+        if self._sindex_ref is not None:
+            sindex, sindex_labels = self._sindex_ref
+            sindex_idxs = sindex_labels.get_indexer(self.inventory.index)
+            if not (sindex_idxs == -1).any():
+                return sindex, sindex_idxs
+
+        try:
+            sindex = self.inventory.sindex
+        except ImportError:
+            sindex = None
+        if sindex is None:
+            return None, None
+
+        # index labels are needed to relate entries of filtered data cubes to the spatial index
+        self._sindex_ref = (sindex, self.inventory.index) if self.inventory.index.is_unique else None
+
+        return sindex, np.arange(len(self.inventory))
+
+    def __ensure_geometry(self):
+        """
+        Retrieves the boundary geometries of all files in the inventory, which do not have a geometry assigned yet.
+        If the spatial dimension of the data cube is a tile dimension, only one file per tile is opened.
+        """
+
+        if 'geometry' not in self.inventory.keys():
+            return
+
+        missing = self.inventory['geometry'].isnull().values
+        if not missing.any():
+            return
+
+        inventory = self.inventory[missing]
+        tilenames = None
+        if self.sdim_name not in [None, 'geometry'] and self.sdim_name in inventory.keys():
+            tilenames = inventory[self.sdim_name]
+
+        geometries = self.inventory['geometry'].copy()
+        geometries[missing] = self.__geometries_from_files(inventory['filepath'], tilenames=tilenames)
+        self.inventory = self.inventory.assign(geometry=geometries)
+
+    def __geometries_from_files(self, filepaths, tilenames=None):
+        """
+        Retrieves the boundary geometries of the given files. If tile names are given, files sharing the same tile
+        are assumed to share the same boundary, i.e. only one file per tile is opened.
+
+        Parameters
+        ----------
+        filepaths : pandas.Series
+            File paths.
+        tilenames : pandas.Series, optional
+            Tile names of each file path.
+
+        Returns
+        -------
+        list of shapely.geometry
+            Shapely polygons representing the boundaries of the given files.
+        """
+
+        if tilenames is not None:
+            tilenames = tilenames.astype(object)
+            # files without a tile name are treated separately
+            geom_keys = tilenames.where(tilenames.notnull(), filepaths)
+        else:
+            geom_keys = filepaths
+
+        is_first = ~geom_keys.duplicated().values
+        uni_geom_keys = geom_keys[is_first]
+        uni_filepaths = filepaths[is_first]
+        uni_geometries = self.__map_files(self.__geometry_from_file, uni_filepaths)
+        geometry_map = dict(zip(uni_geom_keys, uni_geometries))
+
+        return [geometry_map[geom_key] for geom_key in geom_keys]
+
+    def __map_files(self, f, filepaths):
+        """
+        Applies a function to each of the given files. Opening files is I/O bound, so GeoTIFF files are processed
+        concurrently. All other files (e.g. NetCDF files, whose underlying libraries are not thread-safe) are
+        processed one after another.
+
+        Parameters
+        ----------
+        f : function
+            Function expecting a file path as its only argument.
+        filepaths : list of str or pandas.Series
+            File paths.
+
+        Returns
+        -------
+        list
+            Return values of `f` for each file path (in the same order as `filepaths`).
+        """
+
+        filepaths = list(filepaths)
+        results = [None] * len(filepaths)
+        gt_idxs = [i for i, filepath in enumerate(filepaths) if get_file_type(filepath) == 'GeoTIFF']
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            gt_results = executor.map(f, [filepaths[i] for i in gt_idxs])
+            for i, result in zip(gt_idxs, gt_results):
+                results[i] = result
+
+        gt_idxs = set(gt_idxs)
+        for i, filepath in enumerate(filepaths):
+            if i not in gt_idxs:
+                results[i] = f(filepath)
+
+        return results
 
     def __check_spatial_consistency(self):
         """
@@ -1332,47 +1621,44 @@ class EODataCube:
             `SmartFilename` class to handle the interpretation of filenames.
         """
 
-        inventory = OrderedDict()
-        inventory['filepath'] = []
-
-        # fill inventory
+        # collect one record per file and create the data frame at once
+        records = []
+        columns = OrderedDict([('filepath', None)])
         for filepath in filepaths:
-            n = len(inventory['filepath'])
-            local_inventory = OrderedDict()
-            local_inventory['filepath'] = [filepath]
+            record = OrderedDict()
+            record['filepath'] = filepath
 
             # get information from filename
             smart_filename = None
-            try:
-                smart_filename = smart_filename_class.from_filename(os.path.basename(filepath), convert=True)
-            except:
-                pass
+            if smart_filename_class is not None:
+                try:
+                    smart_filename = smart_filename_class.from_filename(os.path.basename(filepath), convert=True)
+                except:
+                    pass
 
             if smart_filename:
                 if dimensions is not None:
                     for dimension in dimensions:
                         try:
-                            local_inventory[dimension] = [smart_filename[dimension]]
+                            record[dimension] = smart_filename[dimension]
                         except:
                             pass
                 else:
                     for key, value in smart_filename.fields.items():
-                        local_inventory[key] = [value]
+                        record[key] = value
 
-            extended_entries = list(local_inventory.values())
-            extended_entries = list(map(list, zip(*extended_entries)))
+            # keep track of the column order, missing entries are filled with NaN
+            columns.update(OrderedDict.fromkeys(record.keys()))
+            records.append(record)
 
-            # add local inventory keys to global inventory if they are not available globally
-            for key in local_inventory.keys():
-                if key not in inventory.keys():
-                    if n == 0:  # first time
-                        inventory[key] = []
-                    else:  # fill dimension with None
-                        inventory[key] = [None] * n
+        inventory = pd.DataFrame.from_records(records, columns=list(columns.keys()))
 
-            for entry in extended_entries:
-                for i, key in enumerate(inventory.keys()):
-                    inventory[key].append(entry[i])
+        # store repeating strings (e.g. tile names, polarisations) only once
+        for column in inventory.columns:
+            if column == 'filepath' or pd.api.types.infer_dtype(inventory[column], skipna=True) != 'string':
+                continue
+            if inventory[column].nunique() < 0.5 * len(inventory):
+                inventory[column] = inventory[column].astype('category')
 
         self.inventory = GeoDataFrame(inventory)
 
@@ -1390,6 +1676,7 @@ class EODataCube:
             are taken, otherwise the expressions are applied for each value and linked with an AND (e.g., ('>=', '<=')).
             They have to have the same length as 'values'. The following comparison operators are allowed:
             - '==': equal to
+            - '!=': not equal to
             - '>=': larger than or equal to
             - '<=': smaller than or equal to
             - '>':  larger than
@@ -1417,10 +1704,11 @@ class EODataCube:
             expressions = ["=="] * n_filters
         else:
             if not isinstance(expressions, list):
-                values = [expressions]
+                expressions = [expressions]
 
-        inventory = copy.deepcopy(self.inventory)
-        filtered_inventories = []
+        # boolean indexing creates new data frames, so the inventory does not need to be copied
+        dim_values = self.inventory[name]
+        masks = []
         for i in range(n_filters):
             value = values[i]
             expression = expressions[i]
@@ -1430,25 +1718,30 @@ class EODataCube:
             if not isinstance(expression, (tuple, list)):
                 expression = [expression]
 
-            if (len(value) == 2) and (len(expression) == 2):
-                filter_cmd = "inventory[(inventory[name] {} value[0]) & " \
-                             "(inventory[name] {} value[1])]".format(expression[0], expression[1])
-            elif (len(value) == 1) and (len(expression) == 1):
-                filter_cmd = "inventory[inventory[name] {} value[0]]".format(expression[0])
-            else:
+            if (len(value) not in [1, 2]) or (len(value) != len(expression)):
                 raise Exception('Length of value (={}) and length of expression (={}) does not match or is larger than 2.'.format(len(value), len(expression)))
 
-            filtered_inventories.append(eval(filter_cmd))
+            mask = np.ones(len(dim_values), dtype=bool)
+            for value_i, expression_i in zip(value, expression):
+                if expression_i not in _OPS.keys():
+                    raise Exception('Comparison operator {} is unknown.'.format(expression_i))
+                if expression_i not in ['==', '!='] and isinstance(dim_values.dtype, pd.CategoricalDtype):
+                    # unordered categories only support (in)equality comparisons
+                    dim_values = dim_values.astype(object)
+                mask &= np.asarray(_OPS[expression_i](dim_values, value_i), dtype=bool)
+            masks.append(mask)
 
         if split:
-            eodcs = [self.__assign_inventory(filtered_inventory, inplace=False)
-                     for filtered_inventory in filtered_inventories]
+            eodcs = [self.__assign_inventory(self.inventory[mask], inplace=False, subset=True) for mask in masks]
             return eodcs
         else:
-            filtered_inventory = pd.concat(filtered_inventories, ignore_index=True)
-            return self.__assign_inventory(filtered_inventory, inplace=inplace)
+            # entries matching any of the filters are kept
+            mask = np.logical_or.reduce(masks)
+            # the index is kept like for all other filters, which allows to reuse the spatial index
+            filtered_inventory = self.inventory[mask]
+            return self.__assign_inventory(filtered_inventory, inplace=inplace, subset=True)
 
-    def __assign_inventory(self, inventory, inplace=True):
+    def __assign_inventory(self, inventory, inplace=True, subset=False):
         """
         Helper method for either create a new data cube or overwrite the old data cube with the given inventory.
 
@@ -1459,6 +1752,9 @@ class EODataCube:
         inplace : boolean, optional
             If true, the current class instance will be altered.
             If false, a new class instance will be returned (default value is False).
+        subset : boolean, optional
+            If true, `inventory` only contains (unaltered) rows of the current inventory with the same index labels,
+            so that the spatial index of the current inventory can be reused (default value is False).
 
         Returns
         -------
@@ -1475,14 +1771,30 @@ class EODataCube:
         else:
             tdim_name = self.tdim_name
 
+        # filtered values should not appear as empty groups or zero counts anymore
+        for column in list(inventory.columns):
+            dim_values = inventory[column]
+            if not isinstance(dim_values.dtype, pd.CategoricalDtype):
+                continue
+            if len(dim_values.cat.categories) != dim_values.nunique():
+                # the given inventory is a new data frame, so only this column is replaced and nothing is copied
+                with pd.option_context('mode.chained_assignment', None):
+                    inventory[column] = dim_values.cat.remove_unused_categories()
+
+        sindex_ref = self._sindex_ref if subset else None
         if inplace:
             self.inventory = inventory
             self.sdim_name = sdim_name
             self.tdim_name = tdim_name
+            self._sindex_ref = sindex_ref
             return self
         else:
-            return self.from_inventory(inventory=inventory, grid=self.grid,
-                                       tdim_name=tdim_name, sdim_name=sdim_name)
+            dc = self.from_inventory(inventory=inventory, grid=self.grid,
+                                     tdim_name=tdim_name, sdim_name=sdim_name)
+            # file metadata does not depend on the data cube, so the cache can be shared
+            dc._metadata_cache = self._metadata_cache
+            dc._sindex_ref = sindex_ref
+            return dc
 
     def __deepcopy__(self, memodict={}):
         """
@@ -1498,13 +1810,7 @@ class EODataCube:
             Deepcopy of a data cube.
         """
 
-        filepaths = copy.deepcopy(self.filepaths)
-        grid = self.grid
-        dimensions = copy.deepcopy(self.dimensions)
-        inventory = copy.deepcopy(self.inventory)
-
-        return EODataCube(filepaths=filepaths, grid=grid, dimensions=dimensions, inventory=inventory,
-                          sdim_name=self.sdim_name, tdim_name=self.tdim_name)
+        return self.clone()
 
     def __getitem__(self, dimension_name):
         """
@@ -1518,10 +1824,13 @@ class EODataCube:
         Returns
         -------
         pandas.DataSeries
-            Column of the internal inventory.
+            Column of the internal inventory. Dimensions with repeating strings (e.g. polarisations) are stored as
+            categorical data, i.e. `unique()` returns a `pandas.Categorical` instead of a `numpy.ndarray`.
         """
 
         if self.inventory is not None and dimension_name in self.inventory.columns:
+            if dimension_name == 'geometry':
+                self.__ensure_geometry()
             return self.inventory[dimension_name]
         else:
             raise DimensionUnkown(dimension_name)
@@ -1573,7 +1882,8 @@ def unite_datacubes(dcs):
     inventories = [dc.inventory for dc in dcs]
 
     # this is a SQL alike UNION operation
-    united_inventory = pd.concat(inventories, ignore_index=True, sort=False).drop_duplicates().reset_index(drop=True)
+    united_inventory = pd.concat(inventories, ignore_index=True, sort=False)
+    united_inventory = united_inventory[~_duplicated(united_inventory)].reset_index(drop=True)
 
     sdim_name = dcs[0].sdim_name
     tdim_name = dcs[0].tdim_name
@@ -1616,7 +1926,7 @@ def intersect_datacubes(dcs, on_dimension=None):
         common_vals = list(set.intersection(*map(set, all_vals)))
         intersected_inventory = intersected_inventory[intersected_inventory[on_dimension].isin(common_vals)]
 
-    intersected_inventory = intersected_inventory.drop_duplicates().reset_index(drop=True)
+    intersected_inventory = intersected_inventory[~_duplicated(intersected_inventory)].reset_index(drop=True)
 
     sdim_name = dcs[0].sdim_name
     tdim_name = dcs[0].tdim_name
@@ -1630,4 +1940,3 @@ def intersect_datacubes(dcs, on_dimension=None):
                                           sdim_name=sdim_name, tdim_name=tdim_name)
 
     return dc_merged
-
@@ -86,8 +86,10 @@ class ProductDataCube(EODataCube):
         # ensure there is a variable dimension
         if dimensions is None:
             dimensions = ['var_name']
-        elif "var_name" not in dimensions:
-            dimensions.append('var_name')
+        else:
+            dimensions = list(dimensions)  # do not alter the list given by the caller
+            if "var_name" not in dimensions:
+                dimensions.append('var_name')
 
         grid = kwargs.get('grid', Equi7Grid(sres).__getattr__(continent))
 
@@ -31,10 +31,8 @@
 Utilities and helping functions for the other modules of yeoda.
 """
 
-# general packages
-import os
-
 # geo packages
+import os
 import ogr
 import osr
 import pytileproj.geometry as geometry
@@ -43,6 +41,11 @@ import shapely.geometry
 # load classes from yeoda's error module
 from yeoda.errors import GeometryUnkown
 
+# relation between file extensions and file types understood by yeoda
+_EXT2TYPE = {'.tif': "GeoTIFF",
+             '.tiff': "GeoTIFF",
+             '.nc': "NetCDF"}
+
 
 def get_file_type(filepath):
     """
@@ -51,7 +54,7 @@ def get_file_type(filepath):
     Parameters
     ----------
     filepath : str
-        File path or filename.
+        File path or filename. The file extension is compared case-insensitively.
 
     Returns
     -------
@@ -59,13 +62,7 @@ def get_file_type(filepath):
         File type if it is understood by yeoda or `None`.
     """
 
-    ext = os.path.splitext(filepath)[1]
-    if ext in ['.tif', '.tiff']:
-        return "GeoTIFF"
-    elif ext in ['.nc']:
-        return "NetCDF"
-    else:
-        return None
+    return _EXT2TYPE.get(os.path.splitext(filepath)[1].lower(), None)
 
 
 def any_geom2ogr_geom(geom, osr_sref):
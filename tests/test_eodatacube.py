@@ -33,13 +33,17 @@ Main code for testing general functionalities of a data cube.
 
 # general imports
 import os
+import copy
+import importlib.util
 import ogr
 import shutil
 import unittest
 import numpy as np
+from geopandas import GeoDataFrame
 
 from tests.setup_test_data import setup_gt_test_data
 from tests.setup_test_data import dirpath_test
+from tests.setup_test_data import roi_test
 
 from equi7grid.equi7grid import Equi7Grid
 from geopathfinder.file_naming import SmartFilename
@@ -48,6 +52,7 @@ from geopathfinder.naming_conventions.sgrt_naming import SgrtFilename
 # import yeoda
 from yeoda.datacube import EODataCube
 from yeoda.products.preprocessed import SIG0DataCube
+from yeoda.products.ssm import SSMDataCube
 
 from yeoda.errors import SpatialInconsistencyError
 
@@ -59,18 +64,26 @@ class EODataCubeTester(unittest.TestCase):
     def setUpClass(cls):
         """ Creates GeoTIFF test data. """
 
-        setup_gt_test_data()
+        cls.gt_filepaths, cls.timestamps = setup_gt_test_data()
+        cls._base_dcs = dict()
 
     @classmethod
     def tearDownClass(cls):
         """ Removes all test data. """
 
-        shutil.rmtree(os.path.join(dirpath_test(), 'data'))
+        shutil.rmtree(os.path.join(dirpath_test(), 'data'), ignore_errors=True)
 
-    def setUp(self):
-        """ Retrieves test data filepaths and auxiliary data. """
+    def _create_dc(self, dimensions):
+        """
+        Returns a copy of a data cube with the given dimensions, which is only created once and then shared by all
+        tests.
+        """
 
-        self.gt_filepaths, self.timestamps = setup_gt_test_data()
+        key = tuple(dimensions)
+        if key not in self._base_dcs.keys():
+            self._base_dcs[key] = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
+                                             dimensions=dimensions)
+        return self._base_dcs[key].clone()
 
     def test_unknown_filename(self):
         """ Checks data cube structure if filename translation fails. """
@@ -89,73 +102,66 @@ class EODataCubeTester(unittest.TestCase):
     def test_rename_dimension(self):
         """ Tests renaming a dimension of a data cube. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'])
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         dc.rename_dimensions({'pol': 'band'}, inplace=True)
         assert 'band' in dc.inventory.columns
         assert 'pol' not in dc.inventory.columns
-        assert len(set(dc['band'])) == 2
+        assert dc['band'].nunique() == 2
 
     def test_add_dimension(self):
         """ Tests adding a dimension to a data cube. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'])
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         dim_values = np.random.rand(len(dc))
         dc.add_dimension("value", dim_values, inplace=True)
         assert "value" in dc.inventory.columns
-        assert list(dc['value']) == dim_values.tolist()
+        assert np.array_equal(dc['value'].values, dim_values)
 
     def test_sort_by_dimension(self):
         """ Tests sorting a dimension of the data cube. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'])
-        timestamps = list(dc['time'])
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         dim_values = np.random.rand(len(dc))
-        timestamps_sorted = np.array(timestamps)[np.argsort(dim_values)].tolist()
+        timestamps_sorted = dc['time'].values[np.argsort(dim_values)]
 
         dc.add_dimension("value", dim_values, inplace=True)
         dc.sort_by_dimension("value", inplace=True)
-        assert list(dc['time']) == timestamps_sorted
+        assert np.array_equal(dc['time'].values, timestamps_sorted)
 
     def test_split_time(self):
         """ Tests splitting of the data cube in time to create multiple data cubes. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'])
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         first_time_interval = (self.timestamps[0], self.timestamps[1])
         second_time_interval = (self.timestamps[2], self.timestamps[-1])
         expression = (">=", "<=")
         dcs = dc.split_by_dimension([first_time_interval, second_time_interval], expressions=[expression, expression])
         assert len(dcs) == 2
-        assert sorted(list(set(dcs[0]['time']))) == self.timestamps[:2]
-        assert sorted(list(set(dcs[1]['time']))) == self.timestamps[2:]
+        assert dcs[0]['time'].drop_duplicates().sort_values().tolist() == self.timestamps[:2]
+        assert dcs[1]['time'].drop_duplicates().sort_values().tolist() == self.timestamps[2:]
 
     def test_split_yearly(self):
         """ Test splitting of the data cube in yearly intervals to create yearly data cubes. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'], tdim_name='time')
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         yearly_dcs = dc.split_yearly()
         assert len(yearly_dcs) == 2
         dcs_2016 = dc.split_yearly(years=2016)
         assert len(dcs_2016) == 1
         dc_2016 = dcs_2016[0]
-        years = [timestamp.year for timestamp in dc_2016['time']]
-        assert (np.array(years) == 2016).all()
+        years = dc_2016['time'].dt.year.values
+        assert (years == 2016).all()
 
     def test_split_monthly(self):
         """ Test splitting of the data cube in monthly intervals to create monthly data cubes. """
 
-        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                        dimensions=['time', 'var_name', 'pol'], tdim_name='time')
+        dc = self._create_dc(['time', 'var_name', 'pol'])
         monthly_dcs = dc.split_monthly()
         assert len(monthly_dcs) == 4
         dcs_feb = dc.split_monthly(months=2)
         assert len(dcs_feb) == 2
-        months = [timestamp.month for dc_feb in dcs_feb for timestamp in dc_feb['time']]
-        assert (np.array(months) == 2).all()
+        months = np.concatenate([dc_feb['time'].dt.month.values for dc_feb in dcs_feb])
+        assert (months == 2).all()
 
     def test_unite(self):
         """
@@ -181,12 +187,12 @@ class EODataCubeTester(unittest.TestCase):
         """
 
         # empty data cube when an intersection is applied
-        dc_1 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time', 'pol'])
-        dc_2 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time', 'orbit_direction'])
-        dc_1.inventory = dc_1.inventory[dc_1['time'] == self.timestamps[0]]
-        dc_2.inventory = dc_2.inventory[dc_2['time'] == self.timestamps[1]]
+        dc_1 = self._create_dc(['time', 'pol'])
+        dc_2 = self._create_dc(['time', 'orbit_direction'])
+        mask_1 = dc_1.inventory['time'].values == np.datetime64(self.timestamps[0])
+        dc_1.inventory = dc_1.inventory.loc[mask_1]
+        mask_2 = dc_2.inventory['time'].values == np.datetime64(self.timestamps[1])
+        dc_2.inventory = dc_2.inventory.loc[mask_2]
         dc_intersected = dc_1.intersect(dc_2, on_dimension='time')
         assert len(dc_intersected) == 0
 
@@ -196,10 +202,8 @@ class EODataCubeTester(unittest.TestCase):
         intersected with the data of to the original data cube.
         """
 
-        dc_1 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time', 'pol'])
-        dc_2 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time', 'orbit_direction'])
+        dc_1 = self._create_dc(['time', 'pol'])
+        dc_2 = self._create_dc(['time', 'orbit_direction'])
 
         dc_intersected = dc_1.intersect(dc_2)
         assert len(dc_intersected) == len(self.gt_filepaths)
@@ -207,22 +211,39 @@ class EODataCubeTester(unittest.TestCase):
         assert 'orbit_direction' not in dc_intersected.dimensions
         assert 'time' in dc_intersected.dimensions
 
+    def test_unite_intersect_geometries(self):
+        """
+        Tests data cube union and intersection of two data cubes containing the same files, whereas only one of them
+        has already retrieved the boundary geometries of its files.
+        """
+
+        dc_1 = self._create_dc(['time', 'pol'])
+        dc_2 = dc_1.clone()
+        assert dc_1.inventory['geometry'].isnull().all()
+        dc_2.load_geometries()
+        assert dc_2.inventory['geometry'].notnull().all()
+        assert dc_1.inventory['geometry'].isnull().all()
+
+        dc_united = dc_1.unite(dc_2)
+        assert len(dc_united) == len(self.gt_filepaths)
+        dc_intersected = dc_1.intersect(dc_2)
+        assert len(dc_intersected) == len(self.gt_filepaths)
+
     def test_intersect_align_dimension_shrink(self):
         """
         Tests matching of entries with two different methods, which should yield the same result: data cube
         intersection and data cube alignment on the temporal dimension.
         """
 
-        dc_1 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time'])
+        dc_1 = self._create_dc(['time'])
         dc_2 = dc_1.clone()
-        dc_2.inventory = dc_2.inventory[dc_2['time'] != self.timestamps[0]]
-        dc_2.inventory = dc_2.inventory[dc_2['time'] != self.timestamps[2]]
+        drop_timestamps = [self.timestamps[0], self.timestamps[2]]
+        dc_2.inventory = dc_2.inventory.loc[~dc_2.inventory['time'].isin(drop_timestamps)]
 
         dc_aligned = dc_1.align_dimension(dc_2, name='time', inplace=False)
         dc_intersected = dc_1.intersect(dc_2, on_dimension='time', inplace=False)
 
-        assert sorted(list(dc_aligned['time'])) == sorted(list(dc_intersected['time']))
+        assert np.array_equal(np.sort(dc_aligned['time'].values), np.sort(dc_intersected['time'].values))
 
     def test_align_dimension_shrink(self):
         """
@@ -231,14 +252,13 @@ class EODataCubeTester(unittest.TestCase):
         in the other data cube.
         """
 
-        dc_1 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time'])
+        dc_1 = self._create_dc(['time'])
         dc_2 = dc_1.clone()
-        dc_2.inventory = dc_2.inventory[dc_2['time'] != self.timestamps[0]]
-        dc_2.inventory = dc_2.inventory[dc_2['time'] != self.timestamps[2]]
+        drop_timestamps = [self.timestamps[0], self.timestamps[2]]
+        dc_2.inventory = dc_2.inventory.loc[~dc_2.inventory['time'].isin(drop_timestamps)]
 
         dc_1.align_dimension(dc_2, name='time', inplace=True)
-        assert sorted(list(set(dc_1['time']))) == [self.timestamps[1], self.timestamps[3]]
+        assert dc_1['time'].drop_duplicates().sort_values().tolist() == [self.timestamps[1], self.timestamps[3]]
 
     def test_align_dimension_grow(self):
         """
@@ -247,8 +267,7 @@ class EODataCubeTester(unittest.TestCase):
         in the other data cube by duplicating the entries.
         """
 
-        dc_1 = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
-                          dimensions=['time'])
+        dc_1 = self._create_dc(['time'])
         dc_2 = dc_1.clone()
         timestamps = list(dc_1['time'])
         subset_idxs = [timestamps.index(self.timestamps[0]),
@@ -258,7 +277,51 @@ class EODataCubeTester(unittest.TestCase):
         dc_1.inventory = dc_1.inventory.iloc[subset_idxs]
 
         dc_1.align_dimension(dc_2, name='time', inplace=True)
-        assert (dc_1['time'] == dc_2['time']).all()
+        times_1 = dc_1['time'].values
+        times_2 = dc_2['time'].values
+        assert times_1.shape == times_2.shape and np.array_equal(times_1, times_2)
+
+    def test_clone(self):
+        """ Tests cloning and deep-copying data cubes of product classes, whose constructors need further arguments. """
+
+        dcs = [SIG0DataCube(filepaths=self.gt_filepaths, dimensions=['time'], sres=500),
+               SSMDataCube(None, filepaths=self.gt_filepaths, dimensions=['time'], sres=500)]
+        for dc in dcs:
+            for dc_clone in [dc.clone(), copy.deepcopy(dc)]:
+                assert type(dc_clone) == type(dc)
+                assert dc_clone.inventory is not dc.inventory
+                assert dc_clone.filepaths == dc.filepaths
+                assert dc_clone.grid is dc.grid
+                assert dc_clone.io_map is not dc.io_map
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is None, "pyarrow is not installed")
+    def test_parquet(self):
+        """ Tests writing and reading the inventory of a data cube to and from a Parquet file. """
+
+        dc = self._create_dc(['time', 'var_name', 'pol'])
+        filepath = os.path.join(dirpath_test(), 'data', 'inventory.parquet')
+        dc.to_parquet(filepath)
+        dc_read = EODataCube.from_parquet(filepath)
+        assert dc_read.filepaths == dc.filepaths
+        assert dc_read.dimensions == dc.dimensions
+        assert list(dc_read['pol']) == list(dc['pol'])
+
+    def test_geofile(self):
+        """ Tests reading the inventory of a data cube from a GeoPackage file with a region of interest as a mask. """
+
+        dc = EODataCube(filepaths=self.gt_filepaths, smart_filename_class=SgrtFilename,
+                        dimensions=['time', 'tile_name'], sdim_name='tile_name')
+        inventory = GeoDataFrame(dc.inventory[['filepath', 'tile_name']].astype(str), geometry=dc['geometry'])
+        filepath = os.path.join(dirpath_test(), 'data', 'inventory.gpkg')
+        inventory.to_file(filepath, driver='GPKG')
+
+        bbox, sref = roi_test()
+        geom = dc.align_geom(bbox, sref=sref)
+        dc_read = EODataCube.from_geofile(filepath, geom=geom, sdim_name='tile_name')
+        filepaths = [filepath for filepath in self.gt_filepaths if "E042N012T6" in filepath]
+        assert len(dc_read) == len(filepaths)
+        assert set(dc_read.filepaths) == set(filepaths)
+        assert dc_read['tile_name'].unique().tolist() == ["E042N012T6"]
 
     def test_boundary_fail(self):
         """ Tests exception triggering when multiple tiles are present in the data cube and a boundary is requested. """
@@ -33,19 +33,26 @@ Main code for testing the filtering of data cubes.
 
 # general imports
 import os
+import re
 import shutil
 import unittest
+import warnings
 
 # test data imports
 from tests.setup_test_data import setup_gt_test_data
 from tests.setup_test_data import dirpath_test
 from tests.setup_test_data import roi_test
 
-# yeoda product imports
+from geopathfinder.naming_conventions.sgrt_naming import SgrtFilename
+
+# yeoda imports
+from yeoda.datacube import EODataCube
 from yeoda.products.preprocessed import PreprocessedDataCube
 from yeoda.products.preprocessed import SIG0DataCube
 from yeoda.products.preprocessed import GMRDataCube
 
+SIG0_PATTERN = re.compile(r".*SIG0.*")
+
 
 class FilteringTester(unittest.TestCase):
     """ Responsible for testing all the filtering functionalities of a data cube. """
@@ -54,59 +61,108 @@ class FilteringTester(unittest.TestCase):
     def setUpClass(cls):
         """ Creates GeoTIFF test data. """
 
-        setup_gt_test_data()
+        cls.filepaths, cls.timestamps = setup_gt_test_data()
+        cls._base_dcs = dict()
 
     @classmethod
     def tearDownClass(cls):
         """ Removes all test data. """
 
-        shutil.rmtree(os.path.join(dirpath_test(), 'data'))
+        shutil.rmtree(os.path.join(dirpath_test(), 'data'), ignore_errors=True)
 
     def setUp(self):
-        """ Retrieves test data filepaths and auxiliary data. """
+        """ Retrieves auxiliary data. """
 
-        self.filepaths, self.timestamps = setup_gt_test_data()
         self.data_dirpath = os.path.join(dirpath_test(), 'data', 'Sentinel-1_CSAR')
 
-    def test_filter_pols_inplace(self):
-        """ Creates a `PreprocessedDataCube` and tests filtering of polarisations on the original data cube. """
+    def _create_dc(self, dc_class, dimensions):
+        """
+        Returns a copy of a data cube of the given class and with the given dimensions, which is only created once
+        and then shared by all tests.
+        """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
-        assert len(set(dc['pol'])) == 2
-        dc.filter_by_dimension("VV", name="pol", inplace=True)
-        assert len(set(dc['pol'])) == 1
+        key = (dc_class, tuple(dimensions))
+        if key not in self._base_dcs.keys():
+            self._base_dcs[key] = dc_class(self.data_dirpath, sres=500, dimensions=list(dimensions))
+        return self._base_dcs[key].clone()
 
-    def test_filter_pols_not_inplace(self):
-        """ Creates a `PreprocessedDataCube` and tests filtering of polarisations on a newly created data cube. """
+    def test_filter_pols(self):
+        """
+        Creates a `PreprocessedDataCube` and tests filtering of polarisations on the original data cube, on a newly
+        created data cube and on a cloned data cube.
+        """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
-        dc_vv = dc.filter_by_dimension("VV", name="pol")
-        dc_vh = dc.filter_by_dimension("VH", name="pol")
-        assert len(set(dc_vv['pol'])) == 1
-        assert list(set(dc_vv['pol']))[0] == "VV"
-        assert len(set(dc_vh['pol'])) == 1
-        assert list(set(dc_vh['pol']))[0] == "VH"
-
-    def test_filter_pols_clone(self):
-        """ Creates a `PreprocessedDataCube` and tests filtering of polarisations on a cloned data cube. """
-
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
-        dc_clone = dc.clone()
-        dc.filter_by_dimension("VV", name="pol", inplace=True)
-        dc_clone.filter_by_dimension("VH", name="pol", inplace=True)
-        assert len(set(dc['pol'])) == 1
-        assert list(set(dc['pol']))[0] == "VV"
-        assert len(set(dc_clone['pol'])) == 1
-        assert list(set(dc_clone['pol']))[0] == "VH"
+        for mode in ['inplace', 'not_inplace', 'clone']:
+            with self.subTest(mode=mode):
+                dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+                assert dc['pol'].nunique() == 2
+                if mode == 'inplace':
+                    dc.filter_by_dimension("VV", name="pol", inplace=True)
+                    assert dc['pol'].nunique() == 1
+                    assert dc['pol'].unique().tolist() == ["VV"]
+                    assert dc['pol'].value_counts().index.tolist() == ["VV"]
+                elif mode == 'not_inplace':
+                    dc_vv = dc.filter_by_dimension("VV", name="pol")
+                    dc_vh = dc.filter_by_dimension("VH", name="pol")
+                    assert dc['pol'].nunique() == 2
+                    assert dc_vv['pol'].nunique() == 1
+                    assert dc_vv['pol'].unique().tolist() == ["VV"]
+                    assert dc_vh['pol'].nunique() == 1
+                    assert dc_vh['pol'].unique().tolist() == ["VH"]
+                else:
+                    dc_clone = dc.clone()
+                    dc.filter_by_dimension("VV", name="pol", inplace=True)
+                    dc_clone.filter_by_dimension("VH", name="pol", inplace=True)
+                    assert dc['pol'].nunique() == 1
+                    assert dc['pol'].unique().tolist() == ["VV"]
+                    assert dc_clone['pol'].nunique() == 1
+                    assert dc_clone['pol'].unique().tolist() == ["VH"]
+
+    def test_filter_pols_expressions(self):
+        """
+        Creates a `PreprocessedDataCube` and tests filtering of polarisations with the inequality operator and with an
+        unknown operator.
+        """
+
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+        dc_vh = dc.filter_by_dimension("VV", expressions="!=", name="pol")
+        assert dc_vh['pol'].unique().tolist() == ["VH"]
+        assert len(dc_vh) == (dc['pol'] == "VH").sum()
+        with self.assertRaises(Exception):
+            dc.filter_by_dimension("VV", expressions="=>", name="pol")
 
     def test_filter_time(self):
         """ Creates a `PreprocessedDataCube` and tests filtering of timestamps. """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
         start_time = self.timestamps[0]
         end_time = self.timestamps[1]
         dc.filter_by_dimension([(start_time, end_time)], expressions=[(">=", "<=")], inplace=True)
-        assert sorted(list(set(dc['time']))) == self.timestamps[:2]
+        assert dc['time'].drop_duplicates().sort_values().tolist() == self.timestamps[:2]
+
+    def test_filter_time_tuple(self):
+        """ Creates a `PreprocessedDataCube` and tests filtering of timestamps given as a single tuple. """
+
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+        start_time = self.timestamps[0]
+        end_time = self.timestamps[1]
+        dc.filter_by_dimension((start_time, end_time), expressions=(">=", "<="), inplace=True)
+        assert dc['time'].drop_duplicates().sort_values().tolist() == self.timestamps[:2]
+
+    def test_filter_time_overlapping(self):
+        """
+        Creates a `PreprocessedDataCube` and tests filtering of timestamps with overlapping time ranges, which should
+        neither duplicate entries nor change their order.
+        """
+
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+        dc_filt = dc.filter_by_dimension([(self.timestamps[0], self.timestamps[1]),
+                                          (self.timestamps[1], self.timestamps[2])],
+                                         expressions=[(">=", "<="), (">=", "<=")])
+        mask = dc['time'].isin(self.timestamps[:3]).values
+        assert len(dc_filt) == mask.sum()
+        assert dc_filt.filepaths == list(dc['filepath'][mask])
+        assert dc_filt.inventory.index.tolist() == dc.inventory.index[mask].tolist()
 
     def test_filter_var_names(self):
         """
@@ -114,13 +170,15 @@ class FilteringTester(unittest.TestCase):
         the `PreprocessedDataCube` in comparison to the other data cubes.
         """
 
-        pre_dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
-        sig0_dc = SIG0DataCube(self.data_dirpath, sres=500, dimensions=['time', 'pol'])
-        gmr_dc = GMRDataCube(self.data_dirpath, sres=500, dimensions=['time', 'pol'])
+        pre_dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+        sig0_dc = self._create_dc(SIG0DataCube, ['time', 'pol'])
+        gmr_dc = self._create_dc(GMRDataCube, ['time', 'pol'])
         dc_filt_sig0 = pre_dc.filter_by_dimension("SIG0", name="var_name")
         dc_filt_gmr = pre_dc.filter_by_dimension("GMR", name="var_name")
-        assert sorted(list(sig0_dc['filepath'])) == sorted(list(dc_filt_sig0['filepath']))
-        assert sorted(list(gmr_dc['filepath'])) == sorted(list(dc_filt_gmr['filepath']))
+        assert sig0_dc['filepath'].size == dc_filt_sig0['filepath'].size
+        assert set(sig0_dc['filepath'].values) == set(dc_filt_sig0['filepath'].values)
+        assert gmr_dc['filepath'].size == dc_filt_gmr['filepath'].size
+        assert set(gmr_dc['filepath'].values) == set(dc_filt_gmr['filepath'].values)
 
     def test_filter_files_with_pattern(self):
         """
@@ -128,20 +186,39 @@ class FilteringTester(unittest.TestCase):
         the `PreprocessedDataCube` in comparison to `SIG0DataCube`.
         """
 
-        pre_dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol'])
-        sig0_dc = SIG0DataCube(self.data_dirpath, sres=500, dimensions=['time', 'pol'])
-        pre_dc.filter_files_with_pattern(".*SIG0.*", inplace=True)
-        assert sorted(list(sig0_dc['filepath'])) == sorted(list(pre_dc['filepath']))
+        pre_dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol'])
+        sig0_dc = self._create_dc(SIG0DataCube, ['time', 'pol'])
+        pre_dc.filter_files_with_pattern(SIG0_PATTERN, inplace=True)
+        assert sig0_dc['filepath'].size == pre_dc['filepath'].size
+        assert set(sig0_dc['filepath'].values) == set(pre_dc['filepath'].values)
+
+    def test_filter_files_with_regex(self):
+        """
+        Creates a `PreprocessedDataCube` and tests filtering of file patterns, which are not a simple substring,
+        applied to file names and full file paths.
+        """
+
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol', 'tile_name'])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            dc_tile = dc.filter_files_with_pattern(r".*(SIG0|GMR-).*_E042N012T6\..*")
+        assert dc_tile['tile_name'].unique().tolist() == ["E042N012T6"]
+        assert len(dc_tile) == (dc['tile_name'] == "E042N012T6").sum()
+
+        sig0_pattern = r".*[/\\]sig0[/\\].*"
+        assert len(dc.filter_files_with_pattern(sig0_pattern)) == 0
+        dc_sig0 = dc.filter_files_with_pattern(sig0_pattern, full_path=True)
+        assert dc_sig0['var_name'].unique().tolist() == ["SIG0"]
+        assert len(dc_sig0) == (dc['var_name'] == "SIG0").sum()
 
     def test_filter_spatially_by_tilename(self):
         """ Creates a `PreprocessedDataCube` and tests filtering of tile names. """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol', 'tile_name'],
-                                  sdim_name="tile_name")
-        assert len(set(dc['tile_name'])) == 2
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol', 'tile_name'])
+        assert dc['tile_name'].nunique() == 2
         dc.filter_spatially_by_tilename("E042N012T6", inplace=True)
-        assert len(set(dc['tile_name'])) == 1
-        assert list(set(dc['tile_name']))[0] == "E042N012T6"
+        assert dc['tile_name'].nunique() == 1
+        assert dc['tile_name'].unique().tolist() == ["E042N012T6"]
 
     def test_filter_spatially_by_geom(self):
         """
@@ -149,22 +226,59 @@ class FilteringTester(unittest.TestCase):
         geometry/region of interest.
         """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'var_name', 'pol', 'tile_name'],
-                                  sdim_name="tile_name")
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'var_name', 'pol', 'tile_name'])
         bbox, sref = roi_test()
-        assert len(set(dc['tile_name'])) == 2
+        assert dc['tile_name'].nunique() == 2
         dc.filter_spatially_by_geom(bbox, sref=sref, inplace=True)
-        assert len(set(dc['tile_name'])) == 1
-        assert list(set(dc['tile_name']))[0] == "E042N012T6"
+        assert dc['tile_name'].nunique() == 1
+        assert dc['tile_name'].unique().tolist() == ["E042N012T6"]
+
+    def test_filter_spatially_by_geom_without_grid(self):
+        """
+        Creates an `EODataCube` without a grid and tests filtering of the file boundaries according to a given
+        geometry/region of interest. The filtered data cube is filtered again to test reusing the spatial index.
+        """
+
+        bbox, sref = roi_test()
+        for sdim_name, dimensions in [('tile_name', ['time', 'var_name', 'pol', 'tile_name']),
+                                      ('geometry', ['time', 'var_name', 'pol'])]:
+            with self.subTest(sdim_name=sdim_name):
+                dc = EODataCube(filepaths=self.filepaths, smart_filename_class=SgrtFilename, dimensions=dimensions,
+                                sdim_name=sdim_name)
+                assert dc.sdim_name == sdim_name
+                dc_filt = dc.filter_spatially_by_geom(bbox, sref=sref)
+                filepaths = [filepath for filepath in self.filepaths if "E042N012T6" in filepath]
+                assert len(dc_filt) == len(filepaths)
+                assert set(dc_filt.filepaths) == set(filepaths)
+                dc_filt.filter_spatially_by_geom(bbox, sref=sref, inplace=True)
+                assert len(dc_filt) == len(filepaths)
+                assert set(dc_filt.filepaths) == set(filepaths)
+
+    def test_filter_spatially_by_geom_reassigned_inventory(self):
+        """
+        Creates an `EODataCube` without a grid and tests filtering of the file boundaries according to a given
+        geometry/region of interest after the inventory of a filtered data cube has been re-indexed.
+        """
+
+        bbox, sref = roi_test()
+        dc = EODataCube(filepaths=self.filepaths, smart_filename_class=SgrtFilename,
+                        dimensions=['time', 'var_name', 'pol'])
+        dc.filter_spatially_by_geom(bbox, sref=sref)
+        dc_vv = dc.filter_by_dimension("VV", name="pol")
+        dc_vv.inventory = dc_vv.inventory.iloc[::-1].reset_index(drop=True)
+        filepaths = [filepath for filepath in dc_vv.filepaths if "E042N012T6" in filepath]
+        dc_vv.filter_spatially_by_geom(bbox, sref=sref, inplace=True)
+        assert len(dc_vv) == len(filepaths)
+        assert set(dc_vv.filepaths) == set(filepaths)
 
     def test_filter_by_metadata(self):
         """ Creates a `PreprocessedDataCube` and tests filtering by metadata. """
 
-        dc = PreprocessedDataCube(self.data_dirpath, sres=500, dimensions=['time', 'orbit_direction'])
-        assert len(set(dc['orbit_direction'])) == 2
+        dc = self._create_dc(PreprocessedDataCube, ['time', 'orbit_direction'])
+        assert dc['orbit_direction'].nunique() == 2
         dc.filter_by_metadata({'direction': 'D'}, inplace=True)
-        assert len(set(dc['orbit_direction'])) == 1
-        assert list(set(dc['orbit_direction']))[0] == "D"
+        assert dc['orbit_direction'].nunique() == 1
+        assert dc['orbit_direction'].unique().tolist() == ["D"]
 
 
 if __name__ == '__main__':
@@ -64,15 +64,15 @@ class LoadingTester(unittest.TestCase):
         multi-variable NetCDF data.
         """
 
-        setup_gt_test_data()
-        setup_nc_multi_test_data()
-        setup_nc_single_test_data()
+        cls.gt_filepaths, cls.timestamps = setup_gt_test_data()
+        cls.nc_filepaths, _ = setup_nc_multi_test_data()
+        cls.nc_filepath, _ = setup_nc_single_test_data()
 
     @classmethod
     def tearDownClass(cls):
         """ Removes all test data. """
 
-        shutil.rmtree(os.path.join(dirpath_test(), 'data'))
+        shutil.rmtree(os.path.join(dirpath_test(), 'data'), ignore_errors=True)
 
     def _create_loadable_dc(self, filepaths):
         """
@@ -96,14 +96,9 @@ class LoadingCoordsTester(LoadingTester):
 
     def setUp(self):
         """
-        Retrieves test data filepaths and auxiliary data and creates temporary reference data as NumPy arrays,
-        xarray arrays and Pandas data frames.
+        Creates auxiliary data and temporary reference data as NumPy arrays, xarray arrays and Pandas data frames.
         """
 
-        self.gt_filepaths, self.timestamps = setup_gt_test_data()
-        self.nc_filepaths, _ = setup_nc_multi_test_data()
-        self.nc_filepath, _ = setup_nc_single_test_data()
-
         self.lon = 5.
         self.lat = 44.
         sref = osr.SpatialReference()
@@ -219,14 +214,9 @@ class LoadingPixelsTester(LoadingTester):
 
     def setUp(self):
         """
-        Retrieves test data filepaths and auxiliary data and creates temporary reference data as NumPy arrays,
-        xarray arrays and Pandas data frames.
+        Creates auxiliary data and temporary reference data as NumPy arrays, xarray arrays and Pandas data frames.
         """
 
-        self.gt_filepaths, self.timestamps = setup_gt_test_data()
-        self.nc_filepaths, _ = setup_nc_multi_test_data()
-        self.nc_filepath, _ = setup_nc_single_test_data()
-
         self.row = 970
         self.col = 246
         self.row_size = 10
@@ -355,14 +345,9 @@ class LoadingGeomTester(LoadingTester):
 
     def setUp(self):
         """
-        Retrieves test data filepaths and auxiliary data and creates temporary reference data as NumPy arrays,
-        xarray arrays and Pandas data frames.
+        Creates auxiliary data and temporary reference data as NumPy arrays, xarray arrays and Pandas data frames.
         """
 
-        self.gt_filepaths, self.timestamps = setup_gt_test_data()
-        self.nc_filepaths, _ = setup_nc_multi_test_data()
-        self.nc_filepath, _ = setup_nc_single_test_data()
-
         row = 246
         col = 970
         x = 4323250.
@@ -0,0 +1,58 @@
+# Copyright (c) 2019, Vienna University of Technology (TU Wien), Department of
+# Geodesy and Geoinformation (GEO).
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# The views and conclusions contained in the software and documentation are
+# those of the authors and should not be interpreted as representing official
+# policies, either expressed or implied, of the FreeBSD Project.
+
+"""
+Main code for testing the utility functions of yeoda.
+"""
+
+# general imports
+import unittest
+
+# import yeoda
+from yeoda.utils import get_file_type
+
+
+class UtilsTester(unittest.TestCase):
+    """ Responsible for testing the utility functions of yeoda. """
+
+    def test_get_file_type(self):
+        """ Tests the determination of file types from file extensions. """
+
+        assert get_file_type("/data/D20160101_000000--_SIG0-----_S1AIWGRDH1VVA_146_T0101_EU500M.tif") == "GeoTIFF"
+        assert get_file_type("/data/image.TIF") == "GeoTIFF"
+        assert get_file_type("image.tiff") == "GeoTIFF"
+        assert get_file_type("/data/stack.nc") == "NetCDF"
+        assert get_file_type("/data/nc") is None
+        assert get_file_type("/data/tif") is None
+        assert get_file_type("/data.nc/image") is None
+        assert get_file_type("/data/image.txt") is None
+
+
+if __name__ == '__main__':
+    unittest.main()